@@ -4,7 +4,7 @@ MCP Server Log Viewer - Compact table-style log viewer for MCP server.
 
 Usage:
     ./scripts/view-logs.py [container_name_or_id]
-    
+
 If no container name is provided, it will find the mcp-stdio-docker-test container automatically.
 
 Features:
@@ -14,7 +14,9 @@ Features:
 - Color-coded status indicators
 """
 
+import asyncio
 import json
+import re
 import subprocess
 import sys
 from datetime import datetime
@@ -31,6 +33,35 @@ class Colors:
     GRAY = "\033[90m"
 
 
+# Prefilter for the raw bytes of each log line: only lines carrying one of
+# these event markers are worth JSON-parsing. Everything else (JSON-RPC
+# frames, debug noise, partial lines) is skipped without touching json.loads.
+_EVENT_RE = re.compile(
+    rb'"message":\s*"(MCP tool called|MCP tool completed|MCP tool failed'
+    rb'|MCP server stopped|Server Starting|MCP server starting)'
+)
+
+# Output templates assembled once at import time: the ANSI escape scaffolding
+# is constant, only the data fields are filled in per line.
+_OK_TMPL = (
+    f"{Colors.GRAY}{{ts}}{Colors.RESET} {Colors.GREEN}✓{Colors.RESET} "
+    f"{Colors.BOLD}{{tool:20s}}{Colors.RESET} {Colors.CYAN}{{args:25s}}{Colors.RESET} "
+    f"{Colors.YELLOW}{{dur:>6.2f}}ms{Colors.RESET} {Colors.DIM}{{size:>4d}}b{Colors.RESET}"
+)
+_FAIL_TMPL = (
+    f"{Colors.GRAY}{{ts}}{Colors.RESET} {Colors.RED}✗{Colors.RESET} "
+    f"{Colors.BOLD}{{tool:20s}}{Colors.RESET} {Colors.RED}{{error}}{Colors.RESET}"
+)
+_START_TMPL = f"\n{Colors.GREEN}{'═' * 80}\n🚀 MCP Server v{{version}}\n{'═' * 80}{Colors.RESET}\n"
+_STOP_TMPL = f"{Colors.YELLOW}⏹  Stopped{Colors.RESET}"
+_HEADER_TMPL = (
+    f"\n{Colors.DIM}{'─' * 80}{Colors.RESET}\n"
+    f"{Colors.BOLD}MCP Server Log Viewer{Colors.RESET} - Container: {Colors.CYAN}{{container}}{Colors.RESET}\n"
+    f"{Colors.DIM}Time     St Tool                 Arguments                  Duration Size{Colors.RESET}\n"
+    f"{Colors.DIM}{'─' * 80}{Colors.RESET}\n"
+)
+
+
 def format_timestamp(ts: str) -> str:
     try:
         dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
@@ -41,59 +72,113 @@ def format_timestamp(ts: str) -> str:
 class RequestTracker:
     def __init__(self):
         self.current_request = {}
-    
-    def process_log(self, log: dict) -> Optional[str]:
-        message = log.get("message", "")
-        timestamp = format_timestamp(log.get("asctime", ""))
-        
-        if "MCP tool called" in message:
-            self.current_request = {
-                'timestamp': timestamp,
-                'tool': log.get("tool_name", "?"),
-                'args': log.get("arguments", {}),
-            }
+        # Dispatch on the marker matched by _EVENT_RE instead of scanning
+        # the message with substring checks.
+        self._handlers = {
+            b"MCP tool called": self._on_called,
+            b"MCP tool completed": self._on_completed,
+            b"MCP tool failed": self._on_failed,
+            b"Server Starting": self._on_started,
+            b"MCP server starting": self._on_started,
+            b"MCP server stopped": self._on_stopped,
+        }
+
+    def process_line(self, line: bytes) -> Optional[str]:
+        """Parse and format a raw log line, or return None if uninteresting."""
+        match = _EVENT_RE.search(line)
+        if not match:
             return None
-        
-        if "MCP tool completed" in message:
-            if not self.current_request:
-                return None
-            
-            tool = self.current_request.get('tool', '?')
-            args = self.current_request.get('args', {})
-            duration = log.get("duration_ms", 0)
-            size = log.get("response_length", 0)
-            ts = self.current_request.get('timestamp', timestamp)
-            
-            # Format args compactly
-            args_str = " ".join(f"{k}={v}" for k, v in args.items()) if args else ""
-            
-            result = f"{Colors.GRAY}{ts}{Colors.RESET} {Colors.GREEN}✓{Colors.RESET} {Colors.BOLD}{tool:20s}{Colors.RESET} {Colors.CYAN}{args_str:25s}{Colors.RESET} {Colors.YELLOW}{duration:>6.2f}ms{Colors.RESET} {Colors.DIM}{size:>4d}b{Colors.RESET}"
-            self.current_request = {}
-            return result
-        
-        if "MCP tool failed" in message:
-            tool = self.current_request.get('tool', log.get("tool_name", "?"))
-            error = log.get("error", "")[:50]
-            ts = self.current_request.get('timestamp', timestamp)
-            result = f"{Colors.GRAY}{ts}{Colors.RESET} {Colors.RED}✗{Colors.RESET} {Colors.BOLD}{tool:20s}{Colors.RESET} {Colors.RED}{error}{Colors.RESET}"
-            self.current_request = {}
-            return result
-        
-        if "Server Starting" in message or "MCP server starting" in message:
-            version = log.get("version", "?")
-            return f"\n{Colors.GREEN}{'═' * 80}\n🚀 MCP Server v{version}\n{'═' * 80}{Colors.RESET}\n"
-        
-        if "MCP server stopped" in message:
-            return f"{Colors.YELLOW}⏹  Stopped{Colors.RESET}"
-        
+        # Lines that pass the prefilter are our own structured log records,
+        # so they parse without needing exception handling on the hot path.
+        return self._handlers[match.group(1)](json.loads(line))
+
+    def _on_called(self, log: dict) -> Optional[str]:
+        self.current_request = {
+            'timestamp': format_timestamp(log.get("asctime", "")),
+            'tool': log.get("tool_name", "?"),
+            'args': log.get("arguments", {}),
+        }
         return None
 
+    def _on_completed(self, log: dict) -> Optional[str]:
+        if not self.current_request:
+            return None
+
+        tool = self.current_request.get('tool', '?')
+        args = self.current_request.get('args', {})
+        duration = log.get("duration_ms", 0)
+        size = log.get("response_length", 0)
+        ts = self.current_request.get('timestamp', format_timestamp(log.get("asctime", "")))
+
+        # Format args compactly
+        args_str = " ".join(f"{k}={v}" for k, v in args.items()) if args else ""
+
+        result = _OK_TMPL.format(ts=ts, tool=tool, args=args_str, dur=duration, size=size)
+        self.current_request = {}
+        return result
+
+    def _on_failed(self, log: dict) -> Optional[str]:
+        tool = self.current_request.get('tool', log.get("tool_name", "?"))
+        error = log.get("error", "")[:50]
+        ts = self.current_request.get('timestamp', format_timestamp(log.get("asctime", "")))
+        result = _FAIL_TMPL.format(ts=ts, tool=tool, error=error)
+        self.current_request = {}
+        return result
+
+    def _on_started(self, log: dict) -> str:
+        return _START_TMPL.format(version=log.get("version", "?"))
+
+    def _on_stopped(self, log: dict) -> str:
+        return _STOP_TMPL
+
 def print_header(container: str):
-    """Print the header."""
-    print(f"\n{Colors.DIM}{'─' * 80}{Colors.RESET}")
-    print(f"{Colors.BOLD}MCP Server Log Viewer{Colors.RESET} - Container: {Colors.CYAN}{container}{Colors.RESET}")
-    print(f"{Colors.DIM}Time     St Tool                 Arguments                  Duration Size{Colors.RESET}")
-    print(f"{Colors.DIM}{'─' * 80}{Colors.RESET}")
+    """Print the header as a single write."""
+    sys.stdout.write(_HEADER_TMPL.format(container=container))
+
+
+async def stream_logs(container: str) -> None:
+    """Stream docker logs, parsing and printing in separate tasks.
+
+    A bounded queue between the reader and the printer gives backpressure:
+    during bursts the reader keeps draining the pipe while the printer
+    catches up, and memory stays capped at the queue size.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "docker", "logs", "-f", container,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+    tracker = RequestTracker()
+
+    async def reader() -> None:
+        buf = bytearray()
+        while True:
+            chunk = await process.stdout.read(1 << 16)
+            if not chunk:
+                break
+            buf += chunk
+            *lines, buf = buf.split(b'\n')
+            for line in lines:
+                formatted = tracker.process_line(line)
+                if formatted:
+                    await queue.put(formatted)
+        await queue.put(None)
+
+    async def printer() -> None:
+        line_count = 0
+        while True:
+            formatted = await queue.get()
+            if formatted is None:
+                break
+            print(formatted, flush=True)
+            line_count += 1
+
+            # Reprint header every 20 lines so it's always visible
+            if line_count % 20 == 0:
+                print_header(container)
+
+    await asyncio.gather(reader(), printer())
 
 
 def main():
@@ -107,34 +192,16 @@ def main():
         containers = [c for c in result.stdout.strip().split("\n") if c]
         if containers:
             container = containers[0]
-    
+
     if not container:
         print(f"{Colors.RED}No container found. Usage: {sys.argv[0]} [container_name]{Colors.RESET}")
         sys.exit(1)
-    
+
     # Print initial header
     print_header(container)
-    
-    line_count = 0
-    tracker = RequestTracker()
+
     try:
-        process = subprocess.Popen(["docker", "logs", "-f", container], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
-        for line in process.stdout:
-            line = line.strip()
-            if not line or line.startswith('{"jsonrpc":'):
-                continue
-            try:
-                log = json.loads(line)
-                formatted = tracker.process_log(log)
-                if formatted:
-                    print(formatted, flush=True)
-                    line_count += 1
-                    
-                    # Reprint header every 20 lines so it's always visible
-                    if line_count % 20 == 0:
-                        print_header(container)
-            except json.JSONDecodeError:
-                pass
+        asyncio.run(stream_logs(container))
     except KeyboardInterrupt:
         print(f"\n{Colors.GRAY}Stopped{Colors.RESET}")
         sys.exit(0)
@@ -2,26 +2,40 @@
 Logging configuration for MCP STDIO Test Server.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-from pythonjsonlogger import jsonlogger
+from logging.handlers import QueueHandler, QueueListener
+
+from pythonjsonlogger.orjson import OrjsonFormatter
 
 
 def configure_logging() -> None:
-    """Configure JSON logging to stderr."""
+    """
+    Configure JSON logging to stderr.
+
+    Records are handed to a queue and written by a background listener
+    thread, so a slow stderr pipe never blocks the asyncio event loop.
+    """
     log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    
-    handler = logging.StreamHandler(sys.stderr)
-    formatter = jsonlogger.JsonFormatter(
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    formatter = OrjsonFormatter(
         fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S",
     )
-    handler.setFormatter(formatter)
-    
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     root_logger.setLevel(getattr(logging, log_level, logging.INFO))
 
 
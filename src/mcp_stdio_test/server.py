@@ -5,7 +5,9 @@ This minimal MCP server is designed to test Docker stdio communications
 without any external dependencies (no APIs, no databases).
 """
 
-import json
+import asyncio
+import logging
+import os
 import random
 import string
 import time
@@ -14,6 +16,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List
 
 import mcp.server.stdio
+import orjson
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
@@ -24,60 +27,119 @@ from mcp_stdio_test.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Dedicated logger for outbound-payload diagnostics so full response
+# payloads can be gated separately from regular server logging.
+diag_logger = get_logger("mcp.diag")
+
 server = Server("mcp-stdio-docker-test")
 
 
+# Tz-aware isoformat is surprisingly expensive and each tool call wants the
+# timestamp more than once, so cache the rendered string at ~1 ms resolution.
+_last_iso_ts = [0.0, ""]
+
+
+def iso_now() -> str:
+    """Return the current UTC time in ISO format, cached at ~1 ms resolution."""
+    t = time.time()
+    if t - _last_iso_ts[0] > 0.001:
+        _last_iso_ts[0] = t
+        _last_iso_ts[1] = datetime.fromtimestamp(t, timezone.utc).isoformat()
+    return _last_iso_ts[1]
+
+
+_ALPHABET = (string.ascii_letters + string.digits).encode()
+_ALEN = len(_ALPHABET)
+
+
+def _string_from_bytes(raw) -> str:
+    """Project random bytes into the alphanumeric alphabet."""
+    return bytes(_ALPHABET[b % _ALEN] for b in raw).decode()
+
+
 def generate_random_string(length: int = 8) -> str:
     """Generate a random alphanumeric string."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return _string_from_bytes(os.urandom(length))
+
+
+# Byte-to-text lookup tables so address formatting is a table index
+# instead of a format call per octet.
+_HEX2 = [format(i, '02x') for i in range(256)]
+_IP_DEC = [str(i) for i in range(256)]
 
 
 def generate_random_ip() -> str:
     """Generate a random IPv4 address."""
-    return f"{random.randint(1, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+    b = os.urandom(4)
+    # Keep the first and last octets out of the zero/broadcast range.
+    first = b[0] or 1
+    last = b[3] if 0 < b[3] < 255 else 1
+    return f"{_IP_DEC[first]}.{_IP_DEC[b[1]]}.{_IP_DEC[b[2]]}.{_IP_DEC[last]}"
 
 
 def generate_random_mac() -> str:
     """Generate a random MAC address."""
-    return ':'.join([f'{random.randint(0, 255):02x}' for _ in range(6)])
+    return ':'.join(_HEX2[b] for b in os.urandom(6))
 
 
-def generate_technical_data() -> Dict[str, Any]:
+_STATUS_VALUES = ["healthy", "degraded", "warning", "critical"]
+
+
+def generate_technical_data_batch(count: int) -> List[Dict[str, Any]]:
     """
-    Generate random structured technical data (~10-15 fields).
-    
-    Returns a dictionary with various technical metrics and identifiers.
+    Generate a batch of random structured technical data records.
+
+    Per-batch work (timestamp formatting, RNG method lookups) is done once
+    and shared across all records instead of being repeated per record.
     """
-    now = datetime.now(timezone.utc)
-    
-    return {
-        "request_id": str(uuid.uuid4()),
-        "timestamp": now.isoformat(),
-        "server_info": {
-            "hostname": f"server-{generate_random_string(6)}",
-            "ip_address": generate_random_ip(),
-            "mac_address": generate_random_mac(),
-            "uptime_seconds": random.randint(3600, 86400 * 30),
-        },
-        "metrics": {
-            "cpu_usage_percent": round(random.uniform(5.0, 95.0), 2),
-            "memory_used_mb": random.randint(512, 16384),
-            "memory_total_mb": 32768,
-            "disk_io_read_mbps": round(random.uniform(0.1, 500.0), 2),
-            "disk_io_write_mbps": round(random.uniform(0.1, 300.0), 2),
-            "network_rx_mbps": round(random.uniform(0.01, 1000.0), 2),
-            "network_tx_mbps": round(random.uniform(0.01, 500.0), 2),
-        },
-        "process_info": {
-            "pid": random.randint(1000, 65535),
-            "threads": random.randint(1, 64),
-            "open_files": random.randint(10, 1000),
-            "connections": random.randint(0, 500),
-        },
-        "status": random.choice(["healthy", "degraded", "warning", "critical"]),
-        "tags": [generate_random_string(4) for _ in range(random.randint(2, 5))],
-        "version": f"{random.randint(1, 5)}.{random.randint(0, 20)}.{random.randint(0, 100)}",
-    }
+    now_iso = iso_now()
+    randint = random.randint
+    uniform = random.uniform
+    choice = random.choice
+
+    # One urandom call covers the tag material for the whole batch
+    # (up to 5 tags of 4 bytes per record); records slice out of the pool.
+    tag_pool = memoryview(os.urandom(count * 20))
+
+    return [
+        {
+            "request_id": str(uuid.uuid4()),
+            "timestamp": now_iso,
+            "server_info": {
+                "hostname": f"server-{generate_random_string(6)}",
+                "ip_address": generate_random_ip(),
+                "mac_address": generate_random_mac(),
+                "uptime_seconds": randint(3600, 86400 * 30),
+            },
+            "metrics": {
+                "cpu_usage_percent": round(uniform(5.0, 95.0), 2),
+                "memory_used_mb": randint(512, 16384),
+                "memory_total_mb": 32768,
+                "disk_io_read_mbps": round(uniform(0.1, 500.0), 2),
+                "disk_io_write_mbps": round(uniform(0.1, 300.0), 2),
+                "network_rx_mbps": round(uniform(0.01, 1000.0), 2),
+                "network_tx_mbps": round(uniform(0.01, 500.0), 2),
+            },
+            "process_info": {
+                "pid": randint(1000, 65535),
+                "threads": randint(1, 64),
+                "open_files": randint(10, 1000),
+                "connections": randint(0, 500),
+            },
+            "status": choice(_STATUS_VALUES),
+            "tags": [
+                _string_from_bytes(tag_pool[i * 20 + j * 4:i * 20 + (j + 1) * 4])
+                for j in range(randint(2, 5))
+            ],
+            "version": f"{randint(1, 5)}.{randint(0, 20)}.{randint(0, 100)}",
+        }
+        for i in range(count)
+    ]
+
+
+def generate_technical_data() -> Dict[str, Any]:
+    """Generate a single random structured technical data record."""
+    return generate_technical_data_batch(1)[0]
 
 
 @server.list_resources()
@@ -156,85 +218,109 @@ async def handle_list_tools() -> list[types.Tool]:
     ]
 
 
+async def _handle_get_random_data(arguments: dict, now_iso: str) -> Dict[str, Any]:
+    """Generate one or more random technical data records."""
+    count = min(max(arguments.get("count", 1), 1), 10)
+    include_delay = arguments.get("include_delay", False)
+
+    if include_delay:
+        delay = random.uniform(0.05, 0.5)
+        await asyncio.sleep(delay)
+
+    if count == 1:
+        return generate_technical_data()
+    return {"records": generate_technical_data_batch(count), "count": count}
+
+
+async def _handle_echo(arguments: dict, now_iso: str) -> Dict[str, Any]:
+    """Echo the provided message back."""
+    message = arguments.get("message", "")
+    return {
+        "echoed_message": message,
+        "timestamp": now_iso,
+        "message_length": len(message),
+    }
+
+
+# Everything in the server-status response except the timestamp is fixed
+# for the lifetime of the process, so build it once at import.
+_STATUS_BASE = {
+    "server_name": "mcp-stdio-docker-test",
+    "version": __version__,
+    "status": "running",
+    "uptime_info": "Server is operational",
+}
+
+
+async def _handle_server_status(arguments: dict, now_iso: str) -> Dict[str, Any]:
+    """Report server status and version."""
+    return {**_STATUS_BASE, "timestamp": now_iso}
+
+
+_TOOL_HANDLERS = {
+    "get-random-data": _handle_get_random_data,
+    "echo": _handle_echo,
+    "server-status": _handle_server_status,
+}
+
+
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """Handle tool call requests."""
-    start_time = time.time()
-    
+    start_time = time.perf_counter()
+    now_iso = iso_now()
+
     if arguments is None:
         arguments = {}
 
-    logger.info("MCP tool called", extra={
-        "tool_name": name,
-        "arguments": arguments,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
-    
+    # Guarded so the extra dicts are never built when INFO is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("MCP tool called", extra={
+            "tool_name": name,
+            "arguments": arguments,
+            "timestamp": now_iso
+        })
+
     try:
-        if name == "get-random-data":
-            count = min(max(arguments.get("count", 1), 1), 10)
-            include_delay = arguments.get("include_delay", False)
-            
-            if include_delay:
-                import asyncio
-                delay = random.uniform(0.05, 0.5)
-                await asyncio.sleep(delay)
-            
-            if count == 1:
-                result = generate_technical_data()
-            else:
-                result = {"records": [generate_technical_data() for _ in range(count)], "count": count}
-            
-        elif name == "echo":
-            message = arguments.get("message", "")
-            result = {
-                "echoed_message": message,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "message_length": len(message),
-            }
-            
-        elif name == "server-status":
-            result = {
-                "server_name": "mcp-stdio-docker-test",
-                "version": __version__,
-                "status": "running",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "uptime_info": "Server is operational",
-            }
-            
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
-        
-        duration_ms = round((time.time() - start_time) * 1000, 2)
-        response_json = json.dumps(result, indent=2)
-        
+
+        result = await handler(arguments, now_iso)
+
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        response_json = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+
         # Comprehensive diagnostic logging for Windsurf stdio bug investigation
-        logger.info(
-            "MCP tool completed",
-            extra={
-                "tool_name": name,
-                "duration_ms": duration_ms,
-                "response_length": len(response_json),
-            },
-        )
-        
-        # Log full outbound JSON-RPC response payload for debugging
-        logger.info(
-            "OUTBOUND JSON-RPC RESPONSE",
-            extra={
-                "tool_name": name,
-                "response_length": len(response_json),
-                "response_payload": response_json,
-                "duration_ms": duration_ms,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "debug_outbound_message": True,
-            },
-        )
-        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "MCP tool completed",
+                extra={
+                    "tool_name": name,
+                    "duration_ms": duration_ms,
+                    "response_length": len(response_json),
+                },
+            )
+
+        # Log full outbound JSON-RPC response payload for debugging; gated so
+        # the payload-sized extra dict is only built when debug logging is on.
+        if diag_logger.isEnabledFor(logging.DEBUG):
+            diag_logger.debug(
+                "OUTBOUND JSON-RPC RESPONSE",
+                extra={
+                    "tool_name": name,
+                    "response_length": len(response_json),
+                    "response_payload": response_json,
+                    "duration_ms": duration_ms,
+                    "timestamp": now_iso,
+                    "debug_outbound_message": True,
+                },
+            )
+
         return [types.TextContent(type="text", text=response_json)]
-        
+
     except Exception as e:
-        duration_ms = round((time.time() - start_time) * 1000, 2)
+        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
         logger.exception(
             "MCP tool failed",
             extra={"tool_name": name, "error": str(e), "duration_ms": duration_ms},
@@ -242,6 +328,18 @@ async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+# Name, version and capabilities are fixed once the handlers above are
+# registered, so the initialization options are built at import time.
+_INIT_OPTS = InitializationOptions(
+    server_name="mcp-stdio-docker-test",
+    server_version=__version__,
+    capabilities=server.get_capabilities(
+        notification_options=NotificationOptions(),
+        experimental_capabilities={},
+    ),
+)
+
+
 async def run_mcp_server() -> None:
     """Run the MCP server with stdio transport."""
     logger.info("MCP server starting", extra={"version": __version__})
@@ -251,14 +349,7 @@ async def run_mcp_server() -> None:
             await server.run(
                 read_stream,
                 write_stream,
-                InitializationOptions(
-                    server_name="mcp-stdio-docker-test",
-                    server_version=__version__,
-                    capabilities=server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
-                    ),
-                ),
+                _INIT_OPTS,
             )
     except Exception as e:
         logger.exception("MCP server crashed", extra={"error": str(e)})